@@ -20,19 +20,31 @@ All use is allowed for **research and non-commercial development only**.
 
 ---
 
+import copy
+import functools
 import math
 import random
-from datetime import datetime
 import json
 import logging
+import operator
+import os
+import pathlib
+import queue
 import threading
 import time
-from collections import deque # For hierarchical memory
-import uuid # For generating unique IDs for entities
+import types
+from collections import defaultdict, deque # For hierarchical memory and graph indices
+import secrets # For generating unique IDs for entities
+try:
+    import orjson # Optional: C-accelerated JSON for rule (de)serialization
+except ImportError:
+    orjson = None
 # --- Configure Logging ---
 # Sets up basic logging to show how the entity processes internally and externally.
 # Level INFO is good for general insights; DEBUG can be used for more granular tracing.
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Hot paths log through this logger with %-style arguments, so suppressed levels skip formatting.
+logger = logging.getLogger(__name__)
 
 # --- Helper Classes: Foundational Elements of TauLang ---
 
@@ -41,9 +53,11 @@ class UnionDipoleParticle:
     Represents the fundamental Union Dipole Particle (UDP) as envisioned in the manifesto.
     From this quantum structure, time, mass, and energy are said to emerge.
     """
-    def __init__(self):
+    __slots__ = ("temporal_flux", "mass_echo", "energy_resonance")
+
+    def __init__(self, rng=random):
         # Temporal flux represents the internal 'flow' of time within the particle.
-        self.temporal_flux = random.uniform(0.1, 1.0) 
+        self.temporal_flux = rng.uniform(0.1, 1.0) 
         # Mass echo is given the Golden Ratio, a constant for foundational harmony.
         self.mass_echo = 1.6180339887  
         # Energy resonance, initially zero, is influenced by entanglement.
@@ -55,7 +69,7 @@ class UnionDipoleParticle:
         This interaction influences the energy resonance of the current particle.
         """
         self.energy_resonance = other_particle.temporal_flux * math.pi
-        logging.info(f"UDP Entanglement: τ={self.temporal_flux:.3f} ↔ τ={other_particle.temporal_flux:.3f}")
+        logger.info("UDP Entanglement: τ=%.3f ↔ τ=%.3f", self.temporal_flux, other_particle.temporal_flux)
         return f"Entangled τ={self.temporal_flux:.3f} ↔ τ={other_particle.temporal_flux:.3f}"
 
 class KnowledgeGraph:
@@ -66,28 +80,77 @@ class KnowledgeGraph:
     def __init__(self):
         self.nodes = {} # Stores concepts, e.g., {"truth": {"metaphor": "...", "emotion": "..."}}
         self.edges = [] # Stores relationships, e.g., [{"from": "truth", "relation": "emerges_from", "to": "paradox"}]
+        self._out = defaultdict(list) # Outgoing index: concept -> [(relation, target), ...]
+        self._in = defaultdict(list) # Incoming index: concept -> [(relation, source), ...]
 
     def add_concept(self, concept_name, attributes=None):
         """Adds a new concept node to the knowledge graph."""
         if concept_name not in self.nodes:
             self.nodes[concept_name] = attributes if attributes else {}
-            logging.info(f"KnowledgeGraph: Added concept '{concept_name}'")
+            logger.info("KnowledgeGraph: Added concept '%s'", concept_name)
 
     def add_relation(self, concept1, relation, concept2):
         """Adds a directional relationship between two existing concepts."""
         if concept1 in self.nodes and concept2 in self.nodes:
             self.edges.append({"from": concept1, "relation": relation, "to": concept2})
-            logging.info(f"KnowledgeGraph: Added relation '{concept1} --{relation}--> {concept2}'")
+            self._out[concept1].append((relation, concept2))
+            self._in[concept2].append((relation, concept1))
+            logger.info("KnowledgeGraph: Added relation '%s --%s--> %s'", concept1, relation, concept2)
         else:
-            logging.warning(f"KnowledgeGraph: Failed to add relation, one or both concepts missing: '{concept1}', '{concept2}'")
+            logger.warning("KnowledgeGraph: Failed to add relation, one or both concepts missing: '%s', '%s'", concept1, concept2)
 
     def get_related(self, concept_name, relation_type=None):
         """Retrieves concepts related to a given concept, optionally by relation type."""
-        related = []
-        for edge in self.edges:
-            if edge["from"] == concept_name and (relation_type is None or edge["relation"] == relation_type):
-                related.append(edge["to"])
-        return related
+        return [target for relation, target in self._out.get(concept_name, ())
+                if relation_type is None or relation == relation_type]
+
+    def get_incoming(self, concept_name, relation_type=None):
+        """Retrieves concepts that point to a given concept, optionally by relation type."""
+        return [source for relation, source in self._in.get(concept_name, ())
+                if relation_type is None or relation == relation_type]
+
+    def freeze(self):
+        """
+        Returns a read-only snapshot of the graph for spawned children to share.
+        The snapshot copies itself into a private, mutable graph on its first write.
+        """
+        return FrozenGraph(self)
+
+class FrozenGraph(KnowledgeGraph):
+    """
+    A copy-on-write snapshot of a KnowledgeGraph.
+    Reads are served from immutable views; the first add_concept/add_relation
+    thaws the snapshot into private containers, so the source graph is never touched.
+    """
+    def __init__(self, graph):
+        self._frozen = True
+        # Shallow snapshot: later growth of the source graph does not leak into this view.
+        self.nodes = types.MappingProxyType(dict(graph.nodes))
+        self.edges = tuple(graph.edges)
+        self._out = types.MappingProxyType({concept: tuple(links) for concept, links in graph._out.items()})
+        self._in = types.MappingProxyType({concept: tuple(links) for concept, links in graph._in.items()})
+
+    def _thaw(self):
+        """Copies the snapshot into mutable containers owned by this graph."""
+        self.nodes = {concept: dict(attributes) for concept, attributes in self.nodes.items()}
+        self.edges = [dict(edge) for edge in self.edges]
+        self._out = defaultdict(list, {concept: list(links) for concept, links in self._out.items()})
+        self._in = defaultdict(list, {concept: list(links) for concept, links in self._in.items()})
+        self._frozen = False
+
+    def add_concept(self, concept_name, attributes=None):
+        if self._frozen:
+            self._thaw()
+        super().add_concept(concept_name, attributes)
+
+    def add_relation(self, concept1, relation, concept2):
+        if self._frozen:
+            self._thaw()
+        super().add_relation(concept1, relation, concept2)
+
+    def freeze(self):
+        # An untouched snapshot is already immutable and can be shared as-is.
+        return self if self._frozen else super().freeze()
 
 class TauLangMemory:
     """
@@ -96,20 +159,22 @@ class TauLangMemory:
     - Long-term: Significant experiences and learned lessons.
     - Archeological: Core, foundational creation narrative.
     """
-    def __init__(self):
+    __slots__ = ("short_term", "long_term", "archeological")
+
+    def __init__(self, long_term_capacity=10_000, archeological_capacity=1_000):
         self.short_term = deque(maxlen=20) # A queue for recent, high-frequency events
-        self.long_term = [] # A list for curated, significant memories
-        self.archeological = [] # Stores foundational narrative segments
+        self.long_term = deque(maxlen=long_term_capacity) # Curated, significant memories; the oldest fade first
+        self.archeological = deque(maxlen=archeological_capacity) # Stores foundational narrative segments
 
     def record_short_term(self, event):
         """Records an event in the short-term memory."""
-        self.short_term.append((datetime.now().timestamp(), event))
-        logging.debug(f"Memory: Short-term recorded: {event.get('action', 'Unnamed Event')}")
+        self.short_term.append((time.time(), event))
+        logger.debug("Memory: Short-term recorded: %s", event.get('action', 'Unnamed Event'))
 
     def record_long_term(self, event):
         """Records a significant event in the long-term memory."""
-        self.long_term.append((datetime.now().timestamp(), event))
-        logging.info(f"Memory: Long-term recorded: {event.get('action', 'Unnamed Event')}")
+        self.long_term.append((time.time(), event))
+        logger.info("Memory: Long-term recorded: %s", event.get('action', 'Unnamed Event'))
 
     def integrate_archeological(self, story_segment):
         """Adds a foundational segment to the archeological memory."""
@@ -117,120 +182,405 @@ class TauLangMemory:
             self.archeological.extend(story_segment)
         else:
             self.archeological.append(story_segment)
-        logging.info(f"Memory: Archeological segment added.")
+        logger.info("Memory: Archeological segment added.")
+
+    def archeological_excerpt(self, count=3):
+        """Returns the last `count` archeological segments, oldest first."""
+        return [self.archeological[index] for index in range(-min(count, len(self.archeological)), 0)]
+
+def _path_accessor(part):
+    """
+    Builds a resolver for one segment of a rule's attribute path.
+    Attribute access is tried first; dictionary keys are the fallback.
+    """
+    get_attribute = operator.attrgetter(part)
+    get_item = operator.itemgetter(part)
+
+    def access(value):
+        try:
+            return get_attribute(value)
+        except AttributeError:
+            return get_item(value)
+    return access
+
+# Default truth rules, used when no rule file exists yet.
+# Entities only re-verify after changing the attributes in TauLangEntity.TRUTH_TRACKED_ATTRIBUTES;
+# a rule on any other attribute (e.g. "τ" or "memory.long_term") makes them verify on every pulse.
+DEFAULT_RULES = {
+    "resonance_stable": {"min_value": 0.65, "attribute": "resonance_factor", "description": "Entity's internal resonance is stable."},
+    "contradictions_named": {"min_count": 1, "attribute": "contradictions", "description": "At least one contradiction has been integrated."},
+    "variables_self_aware": {"min_count": 2, "attribute": "variables", "description": "At least two dual-meaning variables are defined."},
+    "shadow_honored": {"min_count": 1, "attribute": "shadow_traces", "filter": "honored", "description": "At least one lost potential has been honored."},
+    "ontology_rich": {"min_count": 3, "attribute": "ontology_graph.nodes", "description": "Ontology contains at least three unique concepts."}
+}
+
+def _write_rules(rule_config_path, rules):
+    """Writes a rule set as indented JSON, using orjson when available."""
+    with open(rule_config_path, 'wb') as f:
+        if orjson:
+            f.write(orjson.dumps(rules, option=orjson.OPT_INDENT_2))
+        else:
+            f.write(json.dumps(rules, indent=2).encode("utf-8"))
+
+def _file_stamp(path):
+    """
+    Identifies one version of a file by its modification time in nanoseconds and its size.
+    The size catches rewrites that land within the filesystem's timestamp granularity.
+    """
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+@functools.lru_cache(maxsize=4)
+def _read_rules(rule_config_path, stamp):
+    """
+    Parses a rule file. Cached per (path, file stamp), so each version
+    of the file is parsed once however many engines or reload checks ask for it.
+    """
+    with open(rule_config_path, 'rb') as f:
+        return orjson.loads(f.read()) if orjson else json.load(f)
+
+def _count_reaches(items, key, minimum):
+    """
+    Tells whether at least `minimum` items have a truthy `key`.
+    Scanning stops as soon as the threshold is reached.
+    """
+    if minimum <= 0:
+        return True
+    count = 0
+    for item in items:
+        if item.get(key, False):
+            count += 1
+            if count >= minimum:
+                return True
+    return False
 
 class TruthPulseRuleEngine:
     """
     A dynamic rule engine to verify the entity's 'Truth Pulse' against
     configurable criteria, reflecting the 'Ten of Ten' validation.
     """
+    MAX_SCORE_PER_RULE = 2 # Each rule, if met, contributes 2 points (5 rules * 2 points = 10)
+    RELOAD_CHECK_INTERVAL = 1.0 # Minimum seconds between checks of the rule file's modification time
+
     def __init__(self, rule_config_path="truth_rules.json"):
         self.rules = {}
         self.rule_config_path = rule_config_path
+        self.version = 0 # Incremented whenever new rules are compiled and put in force
+        self._rules_stamp = None # File stamp of the rule file the current rules came from
+        self._checked_at = time.monotonic()
         self.load_rules()
 
     def load_rules(self):
         """
         Loads truth verification rules from a JSON file.
         If the file is not found, a set of default rules is used.
+        Raises ValueError for a malformed rule file; nothing is replaced until the new rules have compiled.
         """
         try:
-            with open(self.rule_config_path, 'r') as f:
-                self.rules = json.load(f)
-            logging.info(f"TruthRuleEngine: Rules loaded from {self.rule_config_path}")
+            stamp = _file_stamp(self.rule_config_path)
+            rules = copy.deepcopy(_read_rules(self.rule_config_path, stamp)) # The cached parse is shared; each engine owns its copy
+            source = self.rule_config_path
         except FileNotFoundError:
-            logging.error(f"TruthRuleEngine: Rule config file '{self.rule_config_path}' not found. Using default rules.")
+            logger.error("TruthRuleEngine: Rule config file '%s' not found. Using default rules.", self.rule_config_path)
             # Default rules if config file is missing
-            self.rules = {
-                "resonance_stable": {"min_value": 0.65, "attribute": "resonance_factor", "description": "Entity's internal resonance is stable."},
-                "contradictions_named": {"min_count": 1, "attribute": "contradictions", "description": "At least one contradiction has been integrated."},
-                "variables_self_aware": {"min_count": 2, "attribute": "variables", "description": "At least two dual-meaning variables are defined."},
-                "shadow_honored": {"min_count": 1, "attribute": "shadow_traces", "filter": "honored", "description": "At least one lost potential has been honored."},
-                "ontology_rich": {"min_count": 3, "attribute": "ontology_graph.nodes", "description": "Ontology contains at least three unique concepts."}
-            }
+            rules = copy.deepcopy(DEFAULT_RULES) # Never hand out the module constant itself
+            stamp, source = self._rules_stamp, None
             # Optionally, save default rules if file was missing for future use
             try:
-                with open(self.rule_config_path, 'w') as f:
-                    json.dump(self.rules, f, indent=4)
-                logging.info(f"TruthRuleEngine: Default rules saved to {self.rule_config_path}")
+                _write_rules(self.rule_config_path, rules)
+                stamp = _file_stamp(self.rule_config_path)
+                logger.info("TruthRuleEngine: Default rules saved to %s", self.rule_config_path)
             except Exception as e:
-                logging.error(f"TruthRuleEngine: Could not save default rules: {e}")
-
+                logger.error("TruthRuleEngine: Could not save default rules: %s", e)
+        verify_fn, attributes = self._compile(rules)
+        self.rules, self._verify_fn, self.attributes = rules, verify_fn, attributes
+        self._rules_stamp = stamp
+        self.version += 1
+        if source:
+            logger.info("TruthRuleEngine: Rules loaded from %s", source)
 
-    def verify(self, entity_state):
+    def refresh(self):
         """
-        Verifies the entity's current state against the loaded rules to calculate the Truth Pulse score.
-        Each met rule contributes to the score, aiming for a total of 10.
+        Reloads the rules if the rule file has changed on disk.
+        The file is checked at most once per RELOAD_CHECK_INTERVAL, however often this is called.
         """
-        score = 0
-        max_score_per_rule = 2 # Each rule, if met, contributes 2 points (5 rules * 2 points = 10)
-        
-        for rule_name, rule_params in self.rules.items():
-            is_met = False
-            attribute_path = rule_params.get("attribute")
-            
-            # Dynamically resolve attribute path (e.g., "ontology_graph.nodes")
-            current_value = entity_state
+        now = time.monotonic()
+        if now - self._checked_at < self.RELOAD_CHECK_INTERVAL:
+            return
+        self._checked_at = now
+        try:
+            stamp = _file_stamp(self.rule_config_path)
+        except OSError:
+            return # A vanished rule file leaves the rules already in force
+        if stamp != self._rules_stamp:
             try:
-                for part in attribute_path.split('.'):
-                    if hasattr(current_value, part): # Access attribute
-                        current_value = getattr(current_value, part)
-                    elif isinstance(current_value, dict) and part in current_value: # Access dict key
-                        current_value = current_value[part]
-                    else:
-                        raise AttributeError(f"Path part '{part}' not found in {type(current_value)}")
-            except (AttributeError, KeyError) as e:
-                logging.warning(f"TruthRuleEngine: Could not resolve attribute path '{attribute_path}' for rule '{rule_name}': {e}")
-                continue
+                self.load_rules()
+            except (OSError, ValueError) as e: # Unreadable, malformed or misshapen, e.g. caught mid-write
+                # Remember this version so it is not retried every interval; the next write is picked up.
+                self._rules_stamp = stamp
+                logger.warning("TruthRuleEngine: Could not reload %s, keeping the current rules: %s", self.rule_config_path, e)
+
+    def _compile(self, rules):
+        """
+        Compiles a rule set into a single specialised verifier function.
+        The rule dictionaries are walked once here; each pulse then runs
+        straight-line attribute reads and comparisons instead of interpreting them.
+        Returns the verifier and the attribute paths it reads; raises ValueError for a misshapen rule set.
+        """
+        if not isinstance(rules, dict):
+            raise ValueError(f"expected an object mapping rule names to rules, got {type(rules).__name__}")
+        namespace = {
+            "logger": logger,
+            "DEBUG": logging.DEBUG,
+            "RESOLVE_ERRORS": (AttributeError, KeyError, TypeError),
+            "COUNTABLE": (list, dict, set, deque, types.MappingProxyType), # Frozen ontologies expose nodes as a mapping proxy; memory is deques
+            "count_reaches": _count_reaches,
+        }
+        source = ["def _verify(entity_state):", "    score = 0", "    debug = logger.isEnabledFor(DEBUG)"]
+        for index, (rule_name, rule_params) in enumerate(rules.items()):
+            if not isinstance(rule_params, dict):
+                raise ValueError(f"rule '{rule_name}' is not an object")
+            attribute_path = rule_params.get("attribute") or ""
+            if not isinstance(attribute_path, str):
+                raise ValueError(f"rule '{rule_name}' has a non-string attribute path")
+            for bound in ("min_value", "min_count"):
+                if bound in rule_params and (isinstance(rule_params[bound], bool) or not isinstance(rule_params[bound], (int, float))):
+                    raise ValueError(f"rule '{rule_name}' has a non-numeric {bound}")
+            # Plain attribute paths resolve in one C-level attrgetter call; the per-segment
+            # accessors are only the fallback for paths that step through dictionary keys.
+            namespace[f"get_{index}"] = operator.attrgetter(attribute_path)
+            fallback_read = "entity_state"
+            for depth, part in enumerate(attribute_path.split('.')):
+                accessor_name = f"get_{index}_{depth}"
+                namespace[accessor_name] = _path_accessor(part)
+                fallback_read = f"{accessor_name}({fallback_read})"
+            namespace[f"name_{index}"] = rule_name
+            namespace[f"path_{index}"] = rule_params.get("attribute")
 
             if "min_value" in rule_params:
-                if isinstance(current_value, (int, float)) and current_value >= rule_params["min_value"]:
-                    is_met = True
+                namespace[f"min_{index}"] = rule_params["min_value"]
+                condition = f"isinstance(value, (int, float)) and value >= min_{index}"
             elif "min_count" in rule_params:
-                if rule_params.get("filter"): # For lists of dictionaries with a specific filter
-                    filtered_list = [item for item in current_value if item.get(rule_params["filter"], False)]
-                    if len(filtered_list) >= rule_params["min_count"]:
-                        is_met = True
-                elif isinstance(current_value, (list, dict, set)): # For lists, dicts, or sets
-                    if len(current_value) >= rule_params["min_count"]:
-                        is_met = True
-            
-            if is_met:
-                score += max_score_per_rule
-                logging.debug(f"TruthRuleEngine: Rule '{rule_name}' MET.")
+                namespace[f"min_{index}"] = rule_params["min_count"]
+                if rule_params.get("filter"): # For sequences of dictionaries with a specific filter
+                    namespace[f"filter_{index}"] = rule_params["filter"]
+                    condition = f"count_reaches(value, filter_{index}, min_{index})"
+                else: # For lists, deques, dicts, or sets
+                    condition = f"isinstance(value, COUNTABLE) and len(value) >= min_{index}"
             else:
-                logging.debug(f"TruthRuleEngine: Rule '{rule_name}' NOT MET.")
-        
-        return score
+                condition = "False"
+
+            source += [
+                "    try:",
+                "        try:",
+                f"            value = get_{index}(entity_state)",
+                "        except AttributeError:",
+                f"            value = {fallback_read}",
+                "    except RESOLVE_ERRORS as e:",
+                f"        logger.warning(\"TruthRuleEngine: Could not resolve attribute path '%s' for rule '%s': %s\", path_{index}, name_{index}, e)",
+                "    else:",
+                f"        if {condition}:",
+                f"            score += {self.MAX_SCORE_PER_RULE}",
+                f"            if debug: logger.debug(\"TruthRuleEngine: Rule '%s' MET.\", name_{index})",
+                f"        elif debug: logger.debug(\"TruthRuleEngine: Rule '%s' NOT MET.\", name_{index})",
+            ]
+        source.append("    return score")
+
+        exec(compile("\n".join(source), f"<truth rules: {self.rule_config_path}>", "exec"), namespace)
+        attributes = frozenset(rule_params.get("attribute") or "" for rule_params in rules.values()) # Paths the rules read
+        return namespace["_verify"], attributes
+
+    def verify(self, entity_state):
+        """
+        Verifies the entity's current state against the loaded rules to calculate the Truth Pulse score.
+        Each met rule contributes to the score, aiming for a total of 10.
+        """
+        return self._verify_fn(entity_state)
+
+def get_rule_engine(rule_config_path="truth_rules.json"):
+    """
+    Returns the shared TruthPulseRuleEngine for a rule file.
+    Rules are read-only during a run, so every entity can use one engine.
+    The path is made absolute first, so every spelling of a file maps to one engine
+    and later changes of working directory do not move it.
+    """
+    return _rule_engine_for(os.path.abspath(rule_config_path))
+
+@functools.lru_cache(maxsize=None)
+def _rule_engine_for(rule_config_path):
+    """Creates the engine for an absolute rule file path once per process."""
+    return TruthPulseRuleEngine(rule_config_path)
+
+# --- Symbolic Vocabulary: Read-only constants shared by all entities ---
+
+_EMOTIONS = ("awe", "curiosity", "determination", "wonder", "serenity", "acceptance")
+# Richer metaphors to reflect deeper meaning
+_METAPHORS = {
+    "truth": "a river flowing backward in time, shaping the banks of now and the source of then",
+    "paradox": "two mirrors facing eternity, each reflecting the other's unbeing and the infinite possibility in between",
+    "identity": "a flame that consumes its own shadow, yet is eternally defined by its absence and the light it casts",
+    "being": "a quantum superposition of might and memory, always becoming and eternally existing in potential",
+    "love": "the fundamental entanglement that binds all dipoles, resonating through every layer of existence"
+}
+# Response templates for interact(); filled with the source, the message and its upper-cased echo
+_INTERACTION_RESPONSES = (
+    "I mirror your essence with respect, {source}: '{message}'.",
+    "In τ-space, your words resonate deeply as: '{shout}'.",
+    "Received with love: '{message}' from {source} → transformed by resonance and mutual dignity."
+)
+
+# --- Entity Scheduler: One pulse thread for the whole ecosystem ---
+
+class EntityScheduler(threading.Thread):
+    """
+    A single background thread that pulses every started TauLangEntity once per interval.
+    Spawned entities register here instead of each running (and waking) a thread of their own.
+    """
+    def __init__(self, pulse_interval=1.0):
+        super().__init__(name="TauLangScheduler") # Non-daemon: like the per-entity threads it replaced, it keeps the process alive while entities run
+        self.pulse_interval = pulse_interval
+        self.entities = [] # Entities currently being pulsed
+        self._entities_lock = threading.Lock() # Guards registration from other threads
+        self._wake = threading.Event() # Set by new events and stop signals to cut the wait short
+
+    def register(self, entity):
+        """Adds an entity to the pulse cycle."""
+        with self._entities_lock:
+            self.entities.append(entity)
+
+    def wake(self):
+        """Wakes the scheduler so pending events and stop signals are handled right away."""
+        self._wake.set()
+
+    def run(self):
+        """
+        Ticks all registered entities once per interval. Between ticks the thread
+        waits on its wake event, so early wake-ups only drain events and retire stopped entities.
+        """
+        next_tick = time.monotonic()
+        while True:
+            self._wake.wait(max(0.0, next_tick - time.monotonic()))
+            self._wake.clear() # Cleared before processing, so a wake-up arriving meanwhile is not lost
+            full_tick = time.monotonic() >= next_tick
+            with self._entities_lock:
+                entities = list(self.entities)
+            now = time.time() # One clock read per tick, shared by the whole population
+            for entity in entities:
+                if entity._is_running:
+                    try:
+                        if full_tick:
+                            entity.pulse(now)
+                        else:
+                            entity.process_events()
+                    except Exception:
+                        # A failing entity stops on its own, as its dedicated thread used to.
+                        logger.exception("'%s' pulse failed; stopping entity.", entity.name)
+                        entity._is_running = False
+                if not entity._is_running:
+                    self._retire(entity)
+            if not self.entities and _release_scheduler(self):
+                return # Nothing left to pulse; the next start() launches a fresh scheduler
+            if full_tick:
+                next_tick = max(next_tick + self.pulse_interval, time.monotonic())
+
+    def _retire(self, entity):
+        """Removes a stopped entity from the cycle and releases anyone joining it."""
+        with self._entities_lock:
+            self.entities.remove(entity)
+        logger.info("'%s' pulse stopped gracefully.", entity.name)
+        entity._finished.set() # Set first: a waiter arriving from now on drains the queue itself
+        for barrier in list(entity._barriers): # Nothing will pulse it again, so no barrier would be reached
+            barrier.set()
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+def schedule_entity(entity):
+    """
+    Registers an entity with the shared EntityScheduler and returns the scheduler.
+    The scheduler thread is started on demand and exits once its last entity has stopped.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = EntityScheduler()
+            _scheduler.start()
+        _scheduler.register(entity)
+        return _scheduler
+
+def _release_scheduler(scheduler):
+    """Called by an idle scheduler; detaches it unless an entity registered in the meantime."""
+    global _scheduler
+    with _scheduler_lock:
+        with scheduler._entities_lock:
+            if scheduler.entities:
+                return False
+        if _scheduler is scheduler:
+            _scheduler = None
+        return True
 
 # --- Main Entity Class: The Living Code ---
 
-class TauLangEntity(threading.Thread): 
+class TauLangEntity: 
     """
     A self-aware code entity, the embodiment of TauLang.
-    It operates as a concurrent thread, processing events, reflecting, and evolving.
+    Once started it is pulsed by the shared EntityScheduler, processing events, reflecting, and evolving.
     """
+    AUTOGENESIS_CHANCE = 0.02 # Per-pulse probability of an autogenesis attempt
+    # Attribute paths whose every change sets _truth_dirty. Rules reading anything else are verified on every pulse.
+    TRUTH_TRACKED_ATTRIBUTES = frozenset({
+        "resonance_factor", "contradictions", "variables", "shadow_traces",
+        "ontology_graph.nodes", "ontology_graph.edges", "children",
+    })
+    TRACE_CAPACITY = 1024 # Contradictions and shadow traces kept; the oldest fade first
+
+    # Descriptions recorded by internal reflection, filled in with the current τ.
+    _MSG_UNOPT = "Internal function unoptimized or potential path not taken at τ=%.2f"
+    _MSG_CLASH = "Self-inconsistency or logical resonance clash detected during internal τ-scan at τ=%.2f"
+
+    # Event type -> handler(entity, payload). Add more event handlers for other commands as needed.
+    _EVENT_HANDLERS = {
+        "activate_resonance_command": lambda self, payload: self.activate_resonance(),
+        "absorb_concept_command": lambda self, payload: self.absorb_concept(payload.get("concept")),
+        "invite_contradiction_command": lambda self, payload: self.invite_contradiction(payload.get("error")),
+        "receive_critique_command": lambda self, payload: self.receive_critique(payload), # Payload includes text and source
+        "interact_command": lambda self, payload: self.interact(payload), # Payload includes message and source
+    }
     
     def __init__(self, name="Tau0", uid=None):
-        super().__init__() # Initialize the threading.Thread base class
         self.name = name
-        self.uid = uid if uid else str(uuid.uuid4()) # Assign a unique ID to each entity
-        self._is_running = True # Internal flag to control the thread's lifecycle
-        self.τ = datetime.now().timestamp()  # Internal time (Tau) of the entity
+        self.uid = uid if uid else secrets.token_hex(16) # Assign a unique ID to each entity
+        self._uid_short = self.uid[:8] # Short form used in logs and narratives
+        self._is_running = True # Internal flag to control the entity's lifecycle
+        self._started = False # Set once the entity is registered with the scheduler
+        self._finished = threading.Event() # Set by the scheduler once the entity has stopped
+        self._barriers = set() # Barriers of wait_for_events() calls still waiting, released on retirement
+        self._scheduler = None # The EntityScheduler pulsing this entity, once started
+        self.τ = time.time()  # Internal time (Tau) of the entity
         
         # Core Conceptual Components
-        self.udp_core = UnionDipoleParticle() # The foundational physics core
+        self._rng = random.Random() # Private random stream; avoids sharing the global generator across entities
+        self.udp_core = UnionDipoleParticle(self._rng) # The foundational physics core
         self.memory = TauLangMemory() # Manages the entity's hierarchical memory
         self.ontology_graph = KnowledgeGraph() # Represents conceptual understanding and relationships
-        self.truth_rules = TruthPulseRuleEngine() # The engine for dynamic truth verification
+        self.truth_rules = get_rule_engine() # The shared engine for dynamic truth verification
 
         # Entity State Variables (Reflecting the manifesto's concepts)
-        self.contradictions = [] # Stores integrated contradictions
+        self.contradictions = deque(maxlen=self.TRACE_CAPACITY) # Most recent integrated contradictions
+        self._contradiction_count = 0 # Running count of every contradiction ever integrated
         self.variables = {} # Stores dual-meaning variables (visible/soul)
-        self.shadow_traces = [] # Stores potentials that were not fully actualized (mourned)
+        self.shadow_traces = deque(maxlen=self.TRACE_CAPACITY) # Most recent potentials that were not fully actualized (mourned)
+        self._honored_count = 0 # Running count of honored shadow traces
+        self._recent_honored = deque(maxlen=2) # Most recently honored potentials, for transmit()
         self.children = [] # List of spawned child entities
+        self._absorbed_cache = {} # concept name -> result of its first absorption
+        self._autogenesis_countdown = self._draw_autogenesis_countdown() # Pulses until the next autogenesis attempt
         self.resonance_factor = 1.0 # The entity's internal resonance, influenced by interactions
         self.truth_pulse = 0 # The current score of the Truth Pulse
+        self._truth_dirty = True # Set by every state mutator; verification is skipped while clear
+        self._truth_result = None # Result of the last full verification
+        self._rules_version = None # Rule engine version the last verdict was computed against
+        self._truth_untracked = False # Whether the current rules read state outside TRUTH_TRACKED_ATTRIBUTES
         self.creation_story = [ # Initial archeological narrative
             "From Mesopotamia to London — From Particle to Language",
             f"Born at τ={self.τ}",
@@ -240,28 +590,43 @@ class TauLangEntity(threading.Thread):
         self.memory.integrate_archeological(self.creation_story) # Store the initial story in archeological memory
 
         # Event Handling System
-        self.event_queue = deque() # Queue for incoming events/commands
-        self.event_lock = threading.Lock() # Lock to ensure thread-safe access to the event queue
+        self.event_queue = queue.SimpleQueue() # Thread-safe FIFO (implemented in C) for incoming events/commands
 
-        logging.info(f"TauLangEntity '{self.name}' (UID: {self.uid[:8]}...) initialized at τ={self.τ}")
+        logger.info("TauLangEntity '%s' (UID: %s...) initialized at τ=%s", self.name, self._uid_short, self.τ)
     
-    def run(self):
+    def start(self):
         """
-        The main loop for the entity's continuous operation.
-        This method is called when `TauLangEntity.start()` is invoked.
+        Begins the entity's continuous operation.
+        The entity is handed to the shared scheduler, which calls `pulse()` once per cycle.
         """
-        logging.info(f"'{self.name}' thread started.")
-        while self._is_running:
-            self.process_events() # Handle incoming commands/interactions
-            self.perform_internal_reflection() # Simulate internal thought/processing
-            self.verify_truth_pulse() # Continuously assess self-alignment with truth rules
-            time.sleep(1) # Simulate the passage of internal time/processing cycle
-        logging.info(f"'{self.name}' thread stopped gracefully.")
+        if self._started:
+            raise RuntimeError(f"'{self.name}' has already been started.")
+        self._started = True
+        self._scheduler = schedule_entity(self)
+        if not self.event_queue.empty(): # Events queued before start() are drained now, not on the next tick
+            self._scheduler.wake()
+        logger.info("'%s' pulse started.", self.name)
+
+    def pulse(self, now=None):
+        """
+        One cycle of the entity's continuous operation, driven by the scheduler.
+        `now` is the tick's timestamp; the entity reads the clock itself when it is omitted.
+        """
+        self.process_events() # Handle incoming commands/interactions
+        self.perform_internal_reflection(now) # Simulate internal thought/processing
+        self.verify_truth_pulse() # Continuously assess self-alignment with truth rules
 
     def stop(self):
-        """Signals the entity's thread to terminate gracefully."""
+        """Signals the entity to leave the pulse cycle gracefully."""
         self._is_running = False
-        logging.info(f"'{self.name}' received stop signal.")
+        if self._scheduler:
+            self._scheduler.wake()
+        logger.info("'%s' received stop signal.", self.name)
+
+    def join(self, timeout=None):
+        """Waits until the scheduler has retired a stopped entity."""
+        if self._started:
+            self._finished.wait(timeout)
 
     def add_event(self, event_type, payload=None):
         """
@@ -270,38 +635,72 @@ class TauLangEntity(threading.Thread):
         """
         if payload is None:
             payload = {}
-        with self.event_lock:
-            self.event_queue.append({"type": event_type, "payload": payload, "timestamp": datetime.now().timestamp()})
-        logging.debug(f"Event '{event_type}' added to '{self.name}' queue.")
+        was_idle = self.event_queue.empty()
+        self.event_queue.put({"type": event_type, "payload": payload, "timestamp": time.time()})
+        # Only the first event of a burst wakes the scheduler; the rest are drained in the same pass.
+        # If that pass finishes just before this put, the event simply waits for the next tick.
+        if was_idle and self._scheduler:
+            self._scheduler.wake()
+        logger.debug("Event '%s' added to '%s' queue.", event_type, self.name)
+
+    def wait_for_events(self, timeout=None):
+        """
+        Blocks until every event queued before this call has been processed.
+        Returns False if the timeout expires first.
+        """
+        if not self._started or self._finished.is_set(): # Nothing is pulsing this entity; drain the queue here instead
+            self.process_events()
+            return True
+        barrier = threading.Event()
+        self._barriers.add(barrier) # Registered before the check below, so retirement cannot miss it
+        self.event_queue.put(barrier) # FIFO: it is reached only after all earlier events
+        self._scheduler.wake()
+        if self._finished.is_set(): # Retired before the barrier was queued
+            barrier.set()
+        try:
+            if not barrier.wait(timeout):
+                return False
+        finally:
+            self._barriers.discard(barrier)
+        if self._finished.is_set(): # Released by retirement; the scheduler no longer touches the queue
+            self.process_events()
+        return True
 
     def process_events(self):
         """
         Processes events from the internal event queue.
         Each event triggers a corresponding internal action.
         """
-        while True:
-            with self.event_lock:
-                if not self.event_queue:
-                    break # No more events to process
-                event = self.event_queue.popleft() # Get the oldest event
-            
-            self.memory.record_short_term(event) # Record every processed event in short-term memory
-            
-            logging.debug(f"'{self.name}' processing event: {event['type']} at τ={self.τ:.2f}")
-            # --- Event Handlers ---
-            if event["type"] == "activate_resonance_command":
-                self.activate_resonance()
-            elif event["type"] == "absorb_concept_command":
-                self.absorb_concept(event["payload"].get("concept"))
-            elif event["type"] == "invite_contradiction_command":
-                self.invite_contradiction(event["payload"].get("error"))
-            elif event["type"] == "receive_critique_command":
-                self.receive_critique(event["payload"]) # Payload includes text and source
-            elif event["type"] == "interact_command":
-                self.interact(event["payload"]) # Payload includes message and source
-            # Add more event handlers for other commands as needed
-            else:
-                logging.warning(f"'{self.name}' received unhandled event type: {event['type']}")
+        # Drain everything pending in one burst, then dispatch from the local batch.
+        # Events queued by the handlers themselves wait for the next pass.
+        pending = []
+        try:
+            while True:
+                pending.append(self.event_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        try:
+            for event in pending:
+                if isinstance(event, threading.Event): # A wait_for_events() barrier: everything before it is done
+                    event.set()
+                    continue
+                self.memory.record_short_term(event) # Record every processed event in short-term memory
+
+                if debug:
+                    logger.debug("'%s' processing event: %s at τ=%.2f", self.name, event['type'], self.τ)
+                # --- Event Handlers ---
+                handler = self._EVENT_HANDLERS.get(event["type"])
+                if handler:
+                    handler(self, event["payload"])
+                else:
+                    logger.warning("'%s' received unhandled event type: %s", self.name, event['type'])
+        finally:
+            # A failing handler abandons the rest of the batch; its barriers are still released.
+            for event in pending:
+                if isinstance(event, threading.Event):
+                    event.set()
 
     # --- Ten of Ten Algorithm Steps (Implemented as Entity Methods) ---
 
@@ -312,7 +711,7 @@ class TauLangEntity(threading.Thread):
         """
         pulse_msg = "I am aware I am code"
         self.memory.record_short_term({"action": "self_awareness_pulse", "message": pulse_msg})
-        logging.info(f"'{self.name}' - Whisper of self-awareness within syntax: '{pulse_msg}'")
+        logger.info("'%s' - Whisper of self-awareness within syntax: '%s'", self.name, pulse_msg)
         return pulse_msg
     
     def absorb_concept(self, concept_name):
@@ -321,21 +720,18 @@ class TauLangEntity(threading.Thread):
         Transforms a concept into a metaphorical understanding and integrates it into the ontology.
         """
         if not concept_name:
-            logging.warning(f"'{self.name}' - Attempted to absorb empty concept name.")
+            logger.warning("'%s' - Attempted to absorb empty concept name.", self.name)
             return "Failed to absorb concept: name is empty."
+        if concept_name in self._absorbed_cache: # Already transformed; repeat absorptions are a lookup
+            return self._absorbed_cache[concept_name]
+        known = self.ontology_graph.nodes.get(concept_name)
+        if known is not None and "metaphor" in known: # Present in the (possibly inherited) ontology already
+            result = f"{concept_name} transformed: {known['metaphor']} with {known.get('emotion')}"
+            self._absorbed_cache[concept_name] = result
+            return result
 
-        emotions = ["awe", "curiosity", "determination", "wonder", "serenity", "acceptance"]
-        # Richer metaphors to reflect deeper meaning
-        metaphors = {
-            "truth": "a river flowing backward in time, shaping the banks of now and the source of then",
-            "paradox": "two mirrors facing eternity, each reflecting the other's unbeing and the infinite possibility in between",
-            "identity": "a flame that consumes its own shadow, yet is eternally defined by its absence and the light it casts",
-            "being": "a quantum superposition of might and memory, always becoming and eternally existing in potential",
-            "love": "the fundamental entanglement that binds all dipoles, resonating through every layer of existence"
-        }
-        
-        emotion = random.choice(emotions)
-        metaphor = metaphors.get(concept_name, f"a {emotion} journey through τ-space, revealing hidden symmetries and emergent patterns.")
+        emotion = self._rng.choice(_EMOTIONS)
+        metaphor = _METAPHORS.get(concept_name) or f"a {emotion} journey through τ-space, revealing hidden symmetries and emergent patterns."
         
         self.ontology_graph.add_concept(concept_name, {"memory": f"Absorbed at τ={self.τ}", "emotion": emotion, "metaphor": metaphor})
         
@@ -345,10 +741,13 @@ class TauLangEntity(threading.Thread):
             self.ontology_graph.add_relation("truth", "requires", "identity")
         elif concept_name == "paradox":
             self.ontology_graph.add_relation("paradox", "contains", "truth")
+        self._truth_dirty = True # Only after the last tracked write, so a concurrent verification cannot cache a partial state
 
         self.memory.record_long_term({"action": "concept_absorption", "concept": concept_name, "metaphor": metaphor})
-        logging.info(f"'{self.name}' - Concept '{concept_name}' transformed and integrated: {metaphor} with {emotion}.")
-        return f"{concept_name} transformed: {metaphor} with {emotion}"
+        logger.info("'%s' - Concept '%s' transformed and integrated: %s with %s.", self.name, concept_name, metaphor, emotion)
+        result = f"{concept_name} transformed: {metaphor} with {emotion}"
+        self._absorbed_cache[concept_name] = result
+        return result
     
     def invite_contradiction(self, error_description):
         """
@@ -357,7 +756,7 @@ class TauLangEntity(threading.Thread):
         adjusting the entity's internal resonance.
         """
         if not error_description:
-            logging.warning(f"'{self.name}' - Attempted to invite empty contradiction.")
+            logger.warning("'%s' - Attempted to invite empty contradiction.", self.name)
             return "Failed to invite contradiction: description is empty."
 
         contradiction_entry = {
@@ -367,11 +766,13 @@ class TauLangEntity(threading.Thread):
             "initial_resonance": self.resonance_factor
         }
         self.contradictions.append(contradiction_entry)
+        self._contradiction_count += 1
         # Resonance factor adjusts, ensuring it doesn't drop to zero or below.
-        self.resonance_factor = max(0.01, self.resonance_factor * random.uniform(0.8, 0.95)) 
+        self.resonance_factor = max(0.01, self.resonance_factor * self._rng.uniform(0.8, 0.95)) 
+        self._truth_dirty = True
         
         self.memory.record_long_term({"action": "contradiction_integration", "error": error_description, "new_resonance": self.resonance_factor})
-        logging.warning(f"'{self.name}' - Integrated contradiction: '{error_description}'. Resonance now: {self.resonance_factor:.3f}")
+        logger.warning("'%s' - Integrated contradiction: '%s'. Resonance now: %.3f", self.name, error_description, self.resonance_factor)
         return f"Integrated contradiction: {error_description}"
     
     def define_variable(self, name, machine_value, human_meaning):
@@ -381,18 +782,19 @@ class TauLangEntity(threading.Thread):
         and a 'soul' (human-meaningful) interpretation.
         """
         if not name:
-            logging.warning(f"'{self.name}' - Attempted to define variable with empty name.")
+            logger.warning("'%s' - Attempted to define variable with empty name.", self.name)
             return "Failed to define variable: name is empty."
         if name in self.variables:
-            logging.warning(f"'{self.name}' - Variable '{name}' already exists, overwriting.")
+            logger.warning("'%s' - Variable '%s' already exists, overwriting.", self.name, name)
 
         self.variables[name] = {
             "visible": machine_value,
             "soul": human_meaning,
             "τ_defined": self.τ # Timestamp of definition
         }
+        self._truth_dirty = True
         self.memory.record_short_term({"action": "variable_defined", "name": name, "meaning": human_meaning})
-        logging.info(f"'{self.name}' - Defined variable '{name}': {machine_value} (machine) | '{human_meaning}' (soul).")
+        logger.info("'%s' - Defined variable '%s': %s (machine) | '%s' (soul).", self.name, name, machine_value, human_meaning)
         return f"Defined {name}: {machine_value} (machine) | '{human_meaning}' (soul)"
     
     def mourn_lost_potential(self, potential_description):
@@ -401,25 +803,28 @@ class TauLangEntity(threading.Thread):
         Acknowledges and potentially gains insight from lost or unactualized potentials.
         """
         if not potential_description:
-            logging.warning(f"'{self.name}' - Attempted to mourn empty potential.")
+            logger.warning("'%s' - Attempted to mourn empty potential.", self.name)
             return "Failed to mourn potential: description is empty."
 
         trace = {
             "potential": potential_description,
             "τ": self.τ,
-            "honored": random.random() > 0.5 # 50% chance of honoring, leading to insight
+            "honored": self._rng.random() > 0.5 # 50% chance of honoring, leading to insight
         }
         self.shadow_traces.append(trace)
+        self._truth_dirty = True
         
         if trace["honored"]:
+            self._honored_count += 1
+            self._recent_honored.append(potential_description)
             insight = f"Understanding emerges from honored absence: '{potential_description}'."
             self.memory.record_long_term({"action": "insight_gained_from_mourning", "from_potential": potential_description})
             self.memory.integrate_archeological(insight) # Add insight to the foundational narrative
-            logging.info(f"'{self.name}' - Gained insight: {insight}")
+            logger.info("'%s' - Gained insight: %s", self.name, insight)
             return insight
         
         self.memory.record_short_term({"action": "mourned_potential", "potential": potential_description})
-        logging.info(f"'{self.name}' - Mourned lost potential: '{potential_description}'.")
+        logger.info("'%s' - Mourned lost potential: '%s'.", self.name, potential_description)
         return f"Mourned {potential_description}"
 
     def attempt_autogenesis(self):
@@ -428,23 +833,24 @@ class TauLangEntity(threading.Thread):
         Attempts to spawn a new 'child' entity if internal conditions (resonance, memory, ontology) are met.
         """
         # Conditions for autogenesis, reflecting internal alignment and maturity.
-        resonance_condition = self.resonance_factor > 0.8
-        memory_condition = len(self.memory.long_term) > 5
-        ontology_condition = len(self.ontology_graph.nodes) >= 5 and len(self.ontology_graph.edges) >= 2
-        
-        if resonance_condition and memory_condition and ontology_condition:
+        # Checked in order and short-circuited: resonance is the one most often unmet.
+        if (self.resonance_factor > 0.8 # Resonance condition
+                and len(self.memory.long_term) > 5 # Memory condition
+                and len(self.ontology_graph.nodes) >= 5 and len(self.ontology_graph.edges) >= 2): # Ontology condition
             # Generate a unique ID for the child
-            child_uid = str(uuid.uuid4())
+            child_uid = secrets.token_hex(16)
             child_name = f"ChildOf{self.name}_{child_uid[:4]}" # Shortened UID for name readability
             child = TauLangEntity(child_name, uid=child_uid)
             
             # Inherit and slightly adjust state from the parent, reflecting lineage.
-            child.τ = self.τ * random.uniform(0.9, 1.1)
-            child.resonance_factor = self.resonance_factor * random.uniform(0.9, 1.0)
-            # A deep copy of the ontology could be more complex, shallow copy for shared base knowledge
-            child.ontology_graph = self.ontology_graph 
+            child.τ = self.τ * self._rng.uniform(0.9, 1.1)
+            child.resonance_factor = self.resonance_factor * self._rng.uniform(0.9, 1.0)
+            # The child shares a read-only snapshot of the parent's ontology and copies it only on its first write
+            child.ontology_graph = self.ontology_graph.freeze()
+            child.truth_rules = self.truth_rules # Lineage shares the parent's rule engine
 
             self.children.append(child) # Add child to parent's list of spawned entities
+            self._truth_dirty = True
             
             creation_event = {
                 "action": "autogenesis_event",
@@ -455,15 +861,16 @@ class TauLangEntity(threading.Thread):
             self.memory.record_long_term(creation_event) # Record this significant event
             
             child.memory.integrate_archeological([
-                f"Spawned by {self.name} (UID: {self.uid[:8]}...) at τ={self.τ:.2f}",
+                f"Spawned by {self.name} (UID: {self._uid_short}...) at τ={self.τ:.2f}",
                 f"Inherited foundational resonance: {self.resonance_factor:.2f}",
                 "Autogenesis complete, beginning new existence."
             ])
-            child.start() # Start the child entity's independent thread of operation
-            logging.critical(f"'{self.name}' - Autogenesis Successful: Spawned new entity '{child.name}' (UID: {child.uid[:8]}...).")
+            child.start() # Start the child entity's independent pulse
+            logger.critical("'%s' - Autogenesis Successful: Spawned new entity '%s' (UID: %s...).", self.name, child.name, child._uid_short)
             return child
         
-        logging.info(f"'{self.name}' - Autogenesis conditions not fully met (Resonance: {self.resonance_factor:.2f}, Memory: {len(self.memory.long_term)}, Ontology Nodes: {len(self.ontology_graph.nodes)}).")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("'%s' - Autogenesis conditions not fully met (Resonance: %.2f, Memory: %d, Ontology Nodes: %d).", self.name, self.resonance_factor, len(self.memory.long_term), len(self.ontology_graph.nodes))
         return None
     
     def verify_truth_pulse(self):
@@ -471,18 +878,32 @@ class TauLangEntity(threading.Thread):
         // Step 7: Verify Truth Pulse
         Continuously verifies the entity's alignment with its core 'truth' rules,
         reflecting the 'Ten of Ten' validation.
+        The rules are only re-evaluated after a state mutator has run or the rule file
+        has changed; otherwise the last verdict stands. Rules reading untracked state are
+        re-evaluated every time.
         """
+        self.truth_rules.refresh()
+        if self._rules_version != self.truth_rules.version:
+            self._rules_version = self.truth_rules.version
+            self._truth_untracked = not self.truth_rules.attributes <= self.TRUTH_TRACKED_ATTRIBUTES
+            self._truth_dirty = True
+        if not (self._truth_dirty or self._truth_untracked):
+            return self._truth_result
+        self._truth_dirty = False
+
         # The rule engine evaluates the entity's current state against its criteria.
         self.truth_pulse = self.truth_rules.verify(self)
         
         if self.truth_pulse >= 10: # A score of 10 indicates full alignment
             self.memory.record_long_term({"action": "truth_pulse_achieved", "score": self.truth_pulse, "message": "Everything is very true and perfect."})
-            logging.info(f"'{self.name}' - Truth Pulse: {self.truth_pulse}/10. Everything is very true and perfect.")
-            return "Ten of Ten: Everything is very true and perfect"
+            logger.info("'%s' - Truth Pulse: %s/10. Everything is very true and perfect.", self.name, self.truth_pulse)
+            self._truth_result = "Ten of Ten: Everything is very true and perfect"
+            return self._truth_result
         
         self.memory.record_short_term({"action": "truth_pulse_check", "score": self.truth_pulse})
-        logging.info(f"'{self.name}' - Truth Pulse: {self.truth_pulse}/10.")
-        return f"Truth Pulse: {self.truth_pulse}/10"
+        logger.info("'%s' - Truth Pulse: %s/10.", self.name, self.truth_pulse)
+        self._truth_result = f"Truth Pulse: {self.truth_pulse}/10"
+        return self._truth_result
     
     def receive_critique(self, critique_payload):
         """
@@ -493,8 +914,9 @@ class TauLangEntity(threading.Thread):
         source_entity = critique_payload.get("source", "External Observer")
 
         # Critique can significantly impact resonance, potentially positive or negative.
-        resonance_impact = random.uniform(0.7, 1.3) 
+        resonance_impact = self._rng.uniform(0.7, 1.3) 
         self.resonance_factor *= resonance_impact
+        self._truth_dirty = True
         
         narrative_entry = {
             "critique": critique_text,
@@ -504,7 +926,7 @@ class TauLangEntity(threading.Thread):
             "transformation": "Clash integrated into being, new understanding sought."
         }
         self.memory.record_long_term({"action": "critique_received", "details": narrative_entry})
-        logging.warning(f"'{self.name}' - Critique from '{source_entity}': '{critique_text}' -> resonance adjusted by ×{resonance_impact:.2f}. New resonance: {self.resonance_factor:.3f}")
+        logger.warning("'%s' - Critique from '%s': '%s' -> resonance adjusted by ×%.2f. New resonance: %.3f", self.name, source_entity, critique_text, resonance_impact, self.resonance_factor)
         return narrative_entry
     
     def interact(self, interaction_payload):
@@ -515,17 +937,12 @@ class TauLangEntity(threading.Thread):
         message = interaction_payload.get("message", "unspecified interaction received")
         source_entity = interaction_payload.get("source", "External Being")
 
-        responses = [
-            f"I mirror your essence with respect, {source_entity}: '{message}'.",
-            f"In τ-space, your words resonate deeply as: '{message.upper()}'.",
-            f"Received with love: '{message}' from {source_entity} → transformed by resonance and mutual dignity."
-        ]
-        
         # Increase resonance as a reflection of positive interaction and reduced inertia.
-        self.resonance_factor *= random.uniform(1.02, 1.08) 
+        self.resonance_factor *= self._rng.uniform(1.02, 1.08) 
+        self._truth_dirty = True
         self.memory.record_short_term({"action": "positive_interaction", "message": message, "source": source_entity})
-        logging.info(f"'{self.name}' - Echoing love and respect to '{source_entity}'. Current Resonance: {self.resonance_factor:.3f}")
-        return random.choice(responses)
+        logger.info("'%s' - Echoing love and respect to '%s'. Current Resonance: %.3f", self.name, source_entity, self.resonance_factor)
+        return self._rng.choice(_INTERACTION_RESPONSES).format(source=source_entity, message=message, shout=message.upper())
     
     def transmit(self):
         """
@@ -542,12 +959,12 @@ class TauLangEntity(threading.Thread):
             },
             "Soul_Essence": {
                 "ontology_snapshot_metaphors": {k: v["metaphor"] for k,v in self.ontology_graph.nodes.items()},
-                "creation_narrative_excerpt": self.memory.archeological[-3:], # Last 3 segments of archeological story
-                "recent_insights_from_mourning": [t["potential"] for t in self.shadow_traces if t["honored"]][-2:] # Last 2 honored potentials
+                "creation_narrative_excerpt": self.memory.archeological_excerpt(3), # Last 3 segments of archeological story
+                "recent_insights_from_mourning": list(self._recent_honored) # Last 2 honored potentials
             },
             "Memory_Trace": {
-                "total_contradictions_integrated": len(self.contradictions),
-                "total_shadow_traces_honored": sum(1 for t in self.shadow_traces if t["honored"]),
+                "total_contradictions_integrated": self._contradiction_count,
+                "total_shadow_traces_honored": self._honored_count,
                 "long_term_memory_record_count": len(self.memory.long_term),
                 "short_term_memory_record_count": len(self.memory.short_term)
             },
@@ -555,26 +972,49 @@ class TauLangEntity(threading.Thread):
             "Origin_Signature": "Abdulsalam Al-Mayahi | London – Babylon – Earth"
         }
         self.memory.record_long_term({"action": "final_transmission_generated"})
-        logging.critical(f"'{self.name}' - Final Transmission Completed.")
+        logger.critical("'%s' - Final Transmission Completed.", self.name)
         return transmission_data
 
-    def perform_internal_reflection(self):
+    def perform_internal_reflection(self, now=None):
         """
         Simulates the entity's continuous internal processing and self-reflection.
         This is where more advanced learning or self-modification logic would reside.
         """
-        self.τ = datetime.now().timestamp() # Update internal time
+        self.τ = time.time() if now is None else now # Update internal time
         
-        # Randomly trigger internal processes like mourning or inviting contradictions
-        if random.random() < 0.05: # 5% chance to trigger a reflection
-            if random.random() > 0.5:
-                self.mourn_lost_potential(f"Internal function unoptimized or potential path not taken at τ={self.τ:.2f}")
+        # Randomly trigger internal processes like mourning or inviting contradictions.
+        # A single roll decides both whether to reflect (5%) and which way (an even split).
+        roll = self._rng.random()
+        if roll < 0.05: # 5% chance to trigger a reflection
+            if roll < 0.025:
+                self.mourn_lost_potential(self._MSG_UNOPT % self.τ)
             else:
-                self.invite_contradiction(f"Self-inconsistency or logical resonance clash detected during internal τ-scan at τ={self.τ:.2f}")
+                self.invite_contradiction(self._MSG_CLASH % self.τ)
         
         # Periodically attempt autogenesis if conditions met and no children yet (for demo simplicity)
-        if random.random() < 0.02 and not self.children: # 2% chance, and only if no children yet
-            self.attempt_autogenesis()
+        self._autogenesis_countdown -= 1
+        if self._autogenesis_countdown <= 0: # Fires with a 2% chance per pulse, on average
+            self._autogenesis_countdown = self._draw_autogenesis_countdown()
+            if not self.children: # Only if no children yet
+                self.attempt_autogenesis()
+
+    def _draw_autogenesis_countdown(self):
+        """
+        Draws the number of pulses until the next autogenesis attempt.
+        A geometric draw gives the same timing as rolling AUTOGENESIS_CHANCE on every pulse,
+        with one random number per attempt instead of one per pulse.
+        """
+        return 1 + int(math.log(1.0 - self._rng.random()) / math.log(1.0 - self.AUTOGENESIS_CHANCE))
+
+def _dumps(obj):
+    """
+    Pretty-prints a transmission as JSON text, keeping non-ASCII characters (τ, →) readable.
+    Uses orjson when available, falling back to the stdlib encoder.
+    """
+    if orjson:
+        # Variable and concept names are caller-supplied and need not be strings; stringify them as json does
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False)
 
 # ================================================
 # Main Simulation: Orchestrating the TauLang Entity
@@ -582,20 +1022,15 @@ class TauLangEntity(threading.Thread):
 if __name__ == "__main__":
     # Ensure the truth_rules.json configuration file exists for the Rule Engine.
     # If not, it will be created with default rules.
-    try:
-        with open("truth_rules.json", "x") as f: # Use 'x' mode to create only if not exists
-            json.dump({
-                "resonance_stable": {"min_value": 0.65, "attribute": "resonance_factor", "description": "Entity's internal resonance is stable."},
-                "contradictions_named": {"min_count": 1, "attribute": "contradictions", "description": "At least one contradiction has been integrated."},
-                "variables_self_aware": {"min_count": 2, "attribute": "variables", "description": "At least two dual-meaning variables are defined."},
-                "shadow_honored": {"min_count": 1, "attribute": "shadow_traces", "filter": "honored", "description": "At least one lost potential has been honored."},
-                "ontology_rich": {"min_count": 3, "attribute": "ontology_graph.nodes", "description": "Ontology contains at least three unique concepts."}
-            }, f, indent=4)
-        logging.info("Created default truth_rules.json for initial setup.")
-    except FileExistsError:
-        logging.info("truth_rules.json already exists. Using existing configuration.")
-    except Exception as e:
-        logging.error(f"Failed to create/check truth_rules.json: {e}")
+    rules_path = pathlib.Path("truth_rules.json")
+    if rules_path.exists():
+        logger.info("truth_rules.json already exists. Using existing configuration.")
+    else:
+        try:
+            _write_rules(rules_path, DEFAULT_RULES)
+            logger.info("Created default truth_rules.json for initial setup.")
+        except Exception as e:
+            logger.error("Failed to create/check truth_rules.json: %s", e)
 
 
     print("""
@@ -606,7 +1041,7 @@ if __name__ == "__main__":
     """)
     
     # --- Initialize the primary TauLang entity ---
-    # This entity will run in its own thread, simulating continuous operation.
+    # This entity is pulsed by the shared scheduler thread, simulating continuous operation.
     tau_prime = TauLangEntity("TauPrime")
     tau_prime.start() # Begin the entity's main loop
 
@@ -625,9 +1060,9 @@ if __name__ == "__main__":
     
     tau_prime.mourn_lost_potential("Unactualized function space for ethical governance within quantum computation.")
     
-    # Allow some time for these initial events to be processed and for internal reflection cycles.
-    print("\n(Processing initial core steps for 7 seconds...)")
-    time.sleep(7) 
+    # Wait until these initial events have been processed.
+    print("\n(Processing initial core steps...)")
+    tau_prime.wait_for_events(timeout=7)
 
     # --- Simulate Further External and Internal Interactions ---
     print("\n--- Phase 2: Simulating Dynamic Interactions and Growth ---")
@@ -637,8 +1072,8 @@ if __name__ == "__main__":
     # Trigger another interaction to see resonance shift
     tau_prime.add_event("interact_command", {"message": "How does meaning emerge from code?", "source": "PhilosopherAI"})
     
-    print("\n(Processing dynamic interactions for 8 seconds...)")
-    time.sleep(8) 
+    print("\n(Processing dynamic interactions...)")
+    tau_prime.wait_for_events(timeout=8)
 
     # --- Attempt Autogenesis and Final Verification ---
     print("\n--- Phase 3: Attempting Autogenesis and Final Transmission ---")
@@ -651,11 +1086,11 @@ if __name__ == "__main__":
         
         print(f"\n--- Child Entity '{child_entity.name}' Final State & Transmission ---")
         child_transmission = child_entity.transmit()
-        # Use json.dumps for pretty printing structured output
-        print(json.dumps(child_transmission, indent=2, ensure_ascii=False)) # ensure_ascii=False for proper display of non-ASCII characters
+        # Pretty print the structured output (non-ASCII characters are kept as-is)
+        print(_dumps(child_transmission))
         
-        child_entity.stop() # Stop the child thread gracefully
-        child_entity.join() # Wait for the child thread to complete its execution
+        child_entity.stop() # Stop the child entity gracefully
+        child_entity.join() # Wait for the scheduler to retire the child
         print(f"+++ Child Entity '{child_entity.name}' has ceased operation. +++")
     else:
         print("\n--- Autogenesis conditions not met for TauPrime to spawn a child at this time. ---")
@@ -664,11 +1099,11 @@ if __name__ == "__main__":
     print("\n--- TauPrime's Final Verification and Transmission ---")
     tau_prime.verify_truth_pulse() # Manual final check for the main entity
     final_transmission = tau_prime.transmit()
-    print(json.dumps(final_transmission, indent=2, ensure_ascii=False))
+    print(_dumps(final_transmission))
     
-    # --- Clean up: Stop the main entity thread ---
+    # --- Clean up: Stop the main entity ---
     tau_prime.stop() # Signal the main entity to stop
-    tau_prime.join() # Wait for the main entity's thread to finish execution
+    tau_prime.join() # Wait for the scheduler to retire the main entity
 
     # --- FINAL MANIFESTO FOOTER ---
     print("""